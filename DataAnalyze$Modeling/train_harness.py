@@ -0,0 +1,348 @@
+"""
+모델 선정용 학습 하네스
+
+01_7(RF), 01_8(XGB), 01_9/01_20/01_21(LightGBM), 01_10(CatBoost) 노트북에서
+각각 반복하던 데이터 로딩 → 언더/오버샘플링 → 학습 → 검증 과정을 하나로 묶은 스크립트
+
+- TPS_cancel_data_Final.csv 는 한 번만 읽어서 전처리 후 .npy 로 캐시 (워커는 memory-map 으로 공유)
+- 샘플링(RandomUnderSampler, SMOTE, TomekLinks) 결과도 샘플러별로 캐시
+- 모델 × 파라미터 그리드 × 샘플러 조합을 프로세스 풀에서 병렬 학습
+- 검증 월(p_mt == 10) 기준 early stopping, 결과는 리더보드(csv)로 저장
+
+사용 예시 (노트북과 동일하게 DataAnalyze$Modeling 디렉토리 기준)
+    python train_harness.py --models lgbm xgb --samplers rus smote --workers 8
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import f1_score, roc_auc_score
+from sklearn.model_selection import ParameterGrid
+from sklearn.preprocessing import LabelEncoder, MinMaxScaler, RobustScaler
+
+DATA_PATH = "data/full_data/TPS_cancel_data_Final.csv"
+CACHE_DIR = "data/cache/harness"
+LEADERBOARD_PATH = "data/leaderboard.csv"
+
+# ✅ 노트북과 동일한 월 분할 기준
+TRAIN_MONTHS = [2, 3, 4, 5, 6, 7, 8, 9]
+VAL_MONTH = 10
+TEST_MONTH = 11
+
+# ✅ 전처리 설정 (변경 시 캐시 키가 바뀌어 새로 전처리)
+DROP_COLUMNS = ['sha2_hash', 'p_mt', 'churn']
+STRING_COLUMNS = ['INHOME_RATE']  # 문자열로 변환 후 레이블 인코딩 (노트북과 동일)
+PREPROCESS_VERSION = 1  # 인코딩 로직을 수정하면 1씩 올릴 것
+
+ROBUST_COLUMNS = ['TOTAL_USED_DAYS', 'CH_HH_AVG_MONTH1', 'MONTHS_REMAINING']  # RobustScaler 적용 대상
+RANDOM_STATE = 42
+EARLY_STOPPING_ROUNDS = 50
+
+# ✅ 후보 모델별 파라미터 그리드 (노트북에서 찾은 값 주변으로 설정)
+PARAM_GRIDS = {
+    "rf": {
+        "n_estimators": [200, 400],
+        "max_depth": [10, 20],
+        "min_samples_leaf": [1, 5],
+    },
+    "xgb": {
+        "n_estimators": [1000],
+        "max_depth": [6, 8],
+        "learning_rate": [0.05, 0.1],
+        "subsample": [0.8],
+        "colsample_bytree": [0.6, 0.8],
+    },
+    "lgbm": {
+        "n_estimators": [1000],
+        "max_depth": [31],
+        "learning_rate": [0.03, 0.0616],
+        "num_leaves": [31, 44, 63],
+        "min_child_samples": [125],
+        "subsample": [0.845],
+        "colsample_bytree": [0.6],
+        "reg_alpha": [2.83],
+        "reg_lambda": [9.815],
+    },
+    "catboost": {
+        "iterations": [1000],
+        "depth": [6, 8],
+        "learning_rate": [0.05, 0.1],
+    },
+}
+
+SAMPLERS = ["rus", "smote", "tomek"]
+
+
+# -----------------------------------------------------------
+# 1️⃣ 데이터 로딩 & 전처리 (한 번만 수행 후 캐시)
+# -----------------------------------------------------------
+def _data_key(data_path):
+    """ 원본 CSV 의 경로/크기/수정시각 + 월 분할/전처리 설정으로 캐시 키 생성 """
+    stat = os.stat(data_path)
+    settings = {
+        "data_path": os.path.abspath(data_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "train_months": TRAIN_MONTHS,
+        "val_month": VAL_MONTH,
+        "test_month": TEST_MONTH,
+        "drop_columns": DROP_COLUMNS,
+        "string_columns": STRING_COLUMNS,
+        "preprocess_version": PREPROCESS_VERSION,
+    }
+    raw = json.dumps(settings, sort_keys=True)
+    return hashlib.md5(raw.encode()).hexdigest()[:12], settings
+
+
+def prepare_base(data_path, cache_dir):
+    """
+    CSV 를 읽어 레이블 인코딩 후 train/val/test 배열을 .npy 로 저장
+    - 같은 CSV 에 대해 이미 캐시가 있으면 CSV 를 다시 읽지 않음
+    - 반환값: 캐시 디렉토리 경로
+    """
+    key, settings = _data_key(data_path)
+    base_dir = os.path.join(cache_dir, key)
+    meta_path = os.path.join(base_dir, "meta.json")
+    if os.path.exists(meta_path):
+        print(f"✅ 캐시 사용: {base_dir}")
+        return base_dir
+
+    os.makedirs(base_dir, exist_ok=True)
+    df = pd.read_csv(data_path)
+
+    # INHOME_RATE 컬럼을 object(string) 타입으로 변환 (노트북과 동일)
+    for col in STRING_COLUMNS:
+        df[col] = df[col].astype(str)
+
+    # train, val, test 에 동일한 인코딩 적용
+    features = df.drop(columns=DROP_COLUMNS)
+    for col in features.select_dtypes(include=['object']).columns:
+        features[col] = LabelEncoder().fit_transform(features[col])
+
+    X = features.to_numpy(dtype=np.float32)
+    y = df['churn'].to_numpy(dtype=np.int8)
+    p_mt = df['p_mt'].to_numpy()
+
+    splits = {
+        "train": np.isin(p_mt, TRAIN_MONTHS),
+        "val": p_mt == VAL_MONTH,
+        "test": p_mt == TEST_MONTH,
+    }
+    for name, mask in splits.items():
+        np.save(os.path.join(base_dir, f"X_{name}.npy"), X[mask])
+        np.save(os.path.join(base_dir, f"y_{name}.npy"), y[mask])
+
+    with open(meta_path, "w") as f:
+        json.dump({"columns": list(features.columns), "settings": settings}, f, indent=2)
+
+    print(f"✅ 전처리 및 캐시 저장 완료: {base_dir}")
+    return base_dir
+
+
+def _load(base_dir, name):
+    """ 캐시된 배열을 memory-map 으로 로드 (워커 간 페이지 캐시 공유) """
+    return np.load(os.path.join(base_dir, f"{name}.npy"), mmap_mode="r")
+
+
+# -----------------------------------------------------------
+# 2️⃣ 샘플링 + 스케일링 결과 캐시
+# -----------------------------------------------------------
+def _make_sampler(name):
+    if name == "rus":
+        from imblearn.under_sampling import RandomUnderSampler
+        return RandomUnderSampler(random_state=RANDOM_STATE)
+    if name == "smote":
+        from imblearn.over_sampling import SMOTE
+        return SMOTE(random_state=RANDOM_STATE)
+    if name == "tomek":
+        from imblearn.under_sampling import TomekLinks
+        return TomekLinks(n_jobs=-1)
+    raise ValueError(f"지원하지 않는 샘플러: {name}")
+
+
+def _fold_key(sampler):
+    """ 샘플러 설정/시드/스케일링 컬럼으로 캐시 키 생성 (설정이 바뀌면 새로 샘플링) """
+    settings = {
+        "sampler": sampler,
+        "params": _make_sampler(sampler).get_params(),
+        "random_state": RANDOM_STATE,
+        "robust_columns": ROBUST_COLUMNS,
+    }
+    raw = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.md5(raw.encode()).hexdigest()[:12], settings
+
+
+def prepare_fold(base_dir, sampler):
+    """
+    학습 데이터에 샘플링을 적용하고, 샘플링된 train 기준으로 스케일러를 학습해 저장
+    - 샘플러 설정별 하위 디렉토리에 X_train/y_train/X_val/X_test 저장
+    - 같은 설정으로 이미 존재하면 재사용
+    """
+    key, settings = _fold_key(sampler)
+    fold_dir = os.path.join(base_dir, f"{sampler}_{key}")
+    done_path = os.path.join(fold_dir, "done")
+    if os.path.exists(done_path):
+        return fold_dir
+
+    os.makedirs(fold_dir, exist_ok=True)
+    with open(os.path.join(fold_dir, "settings.json"), "w") as f:
+        json.dump(settings, f, default=str, indent=2)
+    with open(os.path.join(base_dir, "meta.json")) as f:
+        columns = json.load(f)["columns"]
+
+    X_train, y_train = _make_sampler(sampler).fit_resample(
+        np.asarray(_load(base_dir, "X_train")), np.asarray(_load(base_dir, "y_train"))
+    )
+    X_val = np.array(_load(base_dir, "X_val"))
+    X_test = np.array(_load(base_dir, "X_test"))
+
+    # RobustScaler + MinMaxScaler (노트북과 동일한 컬럼 구분)
+    robust_idx = [columns.index(c) for c in ROBUST_COLUMNS]
+    minmax_idx = [i for i in range(len(columns)) if i not in robust_idx]
+    for idx, scaler in ((robust_idx, RobustScaler()), (minmax_idx, MinMaxScaler())):
+        X_train[:, idx] = scaler.fit_transform(X_train[:, idx])
+        X_val[:, idx] = scaler.transform(X_val[:, idx])
+        X_test[:, idx] = scaler.transform(X_test[:, idx])
+
+    np.save(os.path.join(fold_dir, "X_train.npy"), X_train.astype(np.float32))
+    np.save(os.path.join(fold_dir, "y_train.npy"), y_train.astype(np.int8))
+    np.save(os.path.join(fold_dir, "X_val.npy"), X_val.astype(np.float32))
+    np.save(os.path.join(fold_dir, "X_test.npy"), X_test.astype(np.float32))
+    open(done_path, "w").close()
+
+    print(f"✅ {sampler} 샘플링 완료! (train {len(y_train)}건, 양성 {int(y_train.sum())}건)")
+    return fold_dir
+
+
+# -----------------------------------------------------------
+# 3️⃣ 후보 모델 학습 (워커 프로세스에서 실행)
+# -----------------------------------------------------------
+def _fit_model(model_name, params, X_train, y_train, X_val, y_val):
+    """ 모델 생성 및 검증 월 기준 early stopping 학습, (모델, 사용된 반복 수) 반환 """
+    if model_name == "rf":
+        from sklearn.ensemble import RandomForestClassifier
+        model = RandomForestClassifier(**params, random_state=RANDOM_STATE, n_jobs=1)
+        model.fit(X_train, y_train)
+        return model, params.get("n_estimators")
+
+    if model_name == "xgb":
+        from xgboost import XGBClassifier
+        model = XGBClassifier(
+            **params, random_state=RANDOM_STATE, n_jobs=1,
+            eval_metric="auc", early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+        )
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
+        return model, model.best_iteration + 1
+
+    if model_name == "lgbm":
+        from lightgbm import LGBMClassifier, early_stopping
+        # metric="auc" 로 기본 binary_logloss 를 대체 (XGB/CatBoost 와 동일하게 AUC 기준으로만 중단)
+        model = LGBMClassifier(**params, metric="auc", random_state=RANDOM_STATE, n_jobs=1, verbose=-1)
+        model.fit(
+            X_train, y_train, eval_set=[(X_val, y_val)],
+            callbacks=[early_stopping(EARLY_STOPPING_ROUNDS, verbose=False)],
+        )
+        return model, model.best_iteration_
+
+    if model_name == "catboost":
+        from catboost import CatBoostClassifier
+        model = CatBoostClassifier(
+            **params, random_seed=RANDOM_STATE, thread_count=1,
+            eval_metric="AUC", verbose=False,
+        )
+        model.fit(X_train, y_train, eval_set=(X_val, y_val), early_stopping_rounds=EARLY_STOPPING_ROUNDS)
+        return model, model.get_best_iteration() + 1
+
+    raise ValueError(f"지원하지 않는 모델: {model_name}")
+
+
+def run_candidate(base_dir, fold_dir, sampler, model_name, params):
+    """ 하나의 (샘플러, 모델, 파라미터) 조합을 학습하고 리더보드 한 줄을 반환 """
+    start = time.time()
+    X_train = _load(fold_dir, "X_train")
+    y_train = _load(fold_dir, "y_train")
+    X_val = _load(fold_dir, "X_val")
+    X_test = _load(fold_dir, "X_test")
+    y_val = _load(base_dir, "y_val")
+    y_test = _load(base_dir, "y_test")
+
+    model, best_iteration = _fit_model(model_name, params, X_train, y_train, X_val, y_val)
+
+    val_proba = model.predict_proba(X_val)[:, 1]
+    test_proba = model.predict_proba(X_test)[:, 1]
+
+    return {
+        "model": model_name,
+        "sampler": sampler,
+        "params": json.dumps(params, sort_keys=True),
+        "best_iteration": best_iteration,
+        "val_auc": roc_auc_score(y_val, val_proba),
+        "val_f1": f1_score(y_val, val_proba >= 0.5),
+        "test_auc": roc_auc_score(y_test, test_proba),
+        "test_f1": f1_score(y_test, test_proba >= 0.5),
+        "fit_seconds": round(time.time() - start, 1),
+    }
+
+
+# -----------------------------------------------------------
+# 4️⃣ 전체 탐색 실행 & 리더보드 생성
+# -----------------------------------------------------------
+def run_search(models, samplers, data_path=DATA_PATH, cache_dir=CACHE_DIR, workers=None):
+    base_dir = prepare_base(data_path, cache_dir)
+    fold_dirs = {sampler: prepare_fold(base_dir, sampler) for sampler in samplers}
+
+    candidates = [
+        (sampler, model_name, params)
+        for sampler in samplers
+        for model_name in models
+        for params in ParameterGrid(PARAM_GRIDS[model_name])
+    ]
+    print(f"✅ 후보 조합 {len(candidates)}개 학습 시작")
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_candidate, base_dir, fold_dirs[sampler], sampler, model_name, params):
+                (sampler, model_name, params)
+            for sampler, model_name, params in candidates
+        }
+        for future in as_completed(futures):
+            sampler, model_name, params = futures[future]
+            try:
+                row = future.result()
+            except Exception as e:
+                print(f"❌ {model_name}/{sampler} {params} 학습 실패: {e}")
+                continue
+            rows.append(row)
+            print(f"🔹 {model_name}/{sampler} val AUC {row['val_auc']:.4f} ({row['fit_seconds']}s)")
+
+    leaderboard = pd.DataFrame(rows)
+    if not leaderboard.empty:
+        leaderboard = leaderboard.sort_values("val_auc", ascending=False).reset_index(drop=True)
+    return leaderboard
+
+
+def main():
+    parser = argparse.ArgumentParser(description="해지 예측 모델 병렬 하이퍼파라미터 탐색")
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--output", default=LEADERBOARD_PATH)
+    parser.add_argument("--models", nargs="+", default=list(PARAM_GRIDS), choices=list(PARAM_GRIDS))
+    parser.add_argument("--samplers", nargs="+", default=["rus"], choices=SAMPLERS)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+
+    leaderboard = run_search(args.models, args.samplers, args.data, args.cache_dir, args.workers)
+    leaderboard.to_csv(args.output, index=False)
+
+    print(f"\n✅ 리더보드 저장 완료: {args.output}")
+    print(leaderboard.head(10).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import argparse
+import json
+
+import numpy as np
+from sqlalchemy import and_, case, func, inspect
+from sqlalchemy.orm import Session
+
+from models import TpsCancelModels, DriftSketch
+
+# ✅ 모니터링 대상 (모델 입력 피처 + 해지 확률)
+NUMERIC_FEATURES = [
+    "churn_probability",
+    "INHOME_RATE",
+    "TOTAL_USED_DAYS",
+    "TV_I_CNT",
+    "CH_HH_AVG_MONTH1",
+    "MONTHS_REMAINING",
+]
+CATEGORICAL_FEATURES = [
+    "SCRB_PATH_NM_GRP",
+    "CH_LAST_DAYS_BF_GRP",
+    "STB_RES_1M_YN",
+    "AGMT_KIND_NM",
+    "BUNDLE_YN",
+    "AGMT_END_SEG",
+    "AGE_GRP10",
+    "VOC_STOP_CANCEL_MONTH1_YN",
+    "PROD_NM_GRP",
+    "MEDIA_NM_GRP",
+    "VOC_TOTAL_MONTH1_YN",
+]
+
+# ✅ 구간 경계를 정하는 기준 월 (학습 시작 월과 동일한 2월)
+#    - 해지 확률은 0~1 고정 구간(20개)
+#    - 나머지 수치형은 기준 월 데이터의 10분위 경계를 모든 월에 동일하게 적용
+REFERENCE_MONTH = 2
+SCORE_CUTS = [round(x, 2) for x in np.linspace(0, 1, 21)[1:-1]]
+QUANTILES = np.linspace(0, 1, 11)[1:-1]
+
+# ✅ PSI 판정 기준 (업계 관행: 0.1 미만 안정, 0.25 미만 주의, 이상 위험)
+PSI_CAUTION = 0.1
+PSI_RISK = 0.25
+EPSILON = 1e-6
+
+
+def create_table():
+    """ drift_sketches 테이블이 없으면 생성 (기존 테이블은 그대로 유지) """
+    from database import engine
+    DriftSketch.__table__.create(bind=engine, checkfirst=True)
+
+
+# -----------------------------------------------------------
+# 월별 스케치(히스토그램) 생성
+# -----------------------------------------------------------
+def _quantile_cuts(db: Session, p_mt: int):
+    """ 기준 월의 수치형 피처 10분위 경계 계산 (6개 컬럼을 한 번의 쿼리로 조회) """
+    features = NUMERIC_FEATURES[1:]
+    columns = [getattr(TpsCancelModels, f) for f in features]
+    rows = db.query(*columns).filter(TpsCancelModels.p_mt == p_mt).all()
+    values = np.array(rows, dtype=float).reshape(-1, len(features))
+
+    cuts = {"churn_probability": SCORE_CUTS}
+    for i, feature in enumerate(features):
+        column_values = values[:, i][~np.isnan(values[:, i])]
+        cuts[feature] = np.unique(np.quantile(column_values, QUANTILES)).tolist() if column_values.size else []
+    return cuts
+
+
+def _stored_cuts(db: Session, reference_month: int):
+    rows = (
+        db.query(DriftSketch.feature, DriftSketch.bins)
+        .filter(DriftSketch.p_mt == reference_month, DriftSketch.kind == "numeric")
+        .all()
+    )
+    return {feature: json.loads(bins) for feature, bins in rows}
+
+
+def _bucket_conditions(column, cuts):
+    """ 구간별 조건 목록 (마지막은 결측치) """
+    if not cuts:
+        return [column.isnot(None), column.is_(None)]
+
+    conditions = [column < cuts[0]]
+    conditions += [and_(column >= low, column < high) for low, high in zip(cuts, cuts[1:])]
+    conditions += [column >= cuts[-1], column.is_(None)]
+    return conditions
+
+
+def _numeric_sketches(db: Session, p_mt: int, cuts: dict):
+    """ 모든 수치형 피처의 구간별 건수를 SQL 집계 한 번으로 계산 """
+    layout = []
+    expressions = []
+    for feature in NUMERIC_FEATURES:
+        conditions = _bucket_conditions(getattr(TpsCancelModels, feature), cuts[feature])
+        layout.append((feature, len(conditions)))
+        expressions += [func.sum(case((condition, 1), else_=0)) for condition in conditions]
+
+    row = db.query(*expressions).filter(TpsCancelModels.p_mt == p_mt).one()
+
+    sketches = {}
+    position = 0
+    for feature, size in layout:
+        sketches[feature] = [int(v or 0) for v in row[position:position + size]]
+        position += size
+    return sketches
+
+
+def _categorical_sketch(db: Session, p_mt: int, feature: str):
+    column = getattr(TpsCancelModels, feature)
+    rows = (
+        db.query(column, func.count())
+        .filter(TpsCancelModels.p_mt == p_mt)
+        .group_by(column)
+        .all()
+    )
+    categories = [r[0] for r in rows if r[0] is not None]
+    counts = [r[1] for r in rows if r[0] is not None]
+    counts.append(sum(r[1] for r in rows if r[0] is None))  # 결측치 칸
+    return categories, counts
+
+
+def build_month_sketches(db: Session, p_mt: int, reference_month: int = REFERENCE_MONTH):
+    """
+    특정 월(p_mt)의 스케치를 생성해 drift_sketches 테이블에 저장
+    - 해당 월 데이터만 스캔하며, 이미 집계된 월은 덮어씀
+    - 수치형 구간 경계는 기준 월 스케치를 따르며, 기준 월이 없으면 먼저 집계
+    - 반환값: 저장된 피처 수 (해당 월 데이터가 없으면 0)
+    """
+    if not db.query(TpsCancelModels.p_mt).filter(TpsCancelModels.p_mt == p_mt).first():
+        return 0
+
+    if p_mt == reference_month:
+        cuts = _quantile_cuts(db, p_mt)
+    else:
+        cuts = _stored_cuts(db, reference_month)
+        if not cuts:
+            if not build_month_sketches(db, reference_month, reference_month):
+                raise ValueError(f"기준 월({reference_month}) 데이터가 없습니다.")
+            cuts = _stored_cuts(db, reference_month)
+
+    sketches = [
+        ("numeric", feature, cuts[feature], counts)
+        for feature, counts in _numeric_sketches(db, p_mt, cuts).items()
+    ]
+    for feature in CATEGORICAL_FEATURES:
+        categories, counts = _categorical_sketch(db, p_mt, feature)
+        sketches.append(("categorical", feature, categories, counts))
+
+    db.query(DriftSketch).filter(DriftSketch.p_mt == p_mt).delete()
+    for kind, feature, bins, counts in sketches:
+        db.add(DriftSketch(
+            p_mt=p_mt,
+            feature=feature,
+            kind=kind,
+            bins=json.dumps(bins, ensure_ascii=False),
+            counts=json.dumps(counts),
+            total=sum(counts),
+        ))
+
+    db.commit()
+    return len(sketches)
+
+
+def sketched_months(db: Session):
+    """ 스케치가 저장된 월 목록 (drift.py 실행 전이라 테이블이 없으면 빈 목록) """
+    if not inspect(db.get_bind()).has_table(DriftSketch.__tablename__):
+        return []
+    return [row[0] for row in db.query(DriftSketch.p_mt).distinct().order_by(DriftSketch.p_mt).all()]
+
+
+# -----------------------------------------------------------
+# PSI / KS 계산 (저장된 스케치만 사용)
+# -----------------------------------------------------------
+def _proportions(counts):
+    counts = np.asarray(counts, dtype=float)
+    total = counts.sum()
+    if total == 0:
+        return counts
+    return counts / total
+
+
+def _psi(expected, actual):
+    expected = np.clip(_proportions(expected), EPSILON, None)
+    actual = np.clip(_proportions(actual), EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def _ks(expected, actual):
+    """ 결측치 칸을 제외한 구간 누적분포의 최대 차이 """
+    expected_cdf = np.cumsum(_proportions(expected[:-1]))
+    actual_cdf = np.cumsum(_proportions(actual[:-1]))
+    return float(np.max(np.abs(expected_cdf - actual_cdf))) if expected_cdf.size else 0.0
+
+
+def _align_categories(reference: DriftSketch, target: DriftSketch):
+    """ 두 월의 범주를 합쳐 동일한 순서의 counts 로 변환 """
+    ref_bins, ref_counts = json.loads(reference.bins), json.loads(reference.counts)
+    tgt_bins, tgt_counts = json.loads(target.bins), json.loads(target.counts)
+    ref_map = dict(zip(ref_bins, ref_counts))
+    tgt_map = dict(zip(tgt_bins, tgt_counts))
+
+    categories = sorted(set(ref_bins) | set(tgt_bins))
+    expected = [ref_map.get(c, 0) for c in categories] + [ref_counts[-1]]
+    actual = [tgt_map.get(c, 0) for c in categories] + [tgt_counts[-1]]
+    return expected, actual
+
+
+def _status(psi: float):
+    if psi < PSI_CAUTION:
+        return "안정"
+    if psi < PSI_RISK:
+        return "주의"
+    return "위험"
+
+
+def compare_months(db: Session, reference_month: int, p_mt: int):
+    """ 기준 월 대비 특정 월의 피처별 PSI/KS 목록 반환 """
+    sketches = db.query(DriftSketch).filter(DriftSketch.p_mt.in_([reference_month, p_mt])).all()
+    reference = {s.feature: s for s in sketches if s.p_mt == reference_month}
+    target = {s.feature: s for s in sketches if s.p_mt == p_mt}
+
+    results = []
+    for feature in NUMERIC_FEATURES + CATEGORICAL_FEATURES:
+        if feature not in reference or feature not in target:
+            continue
+        ref, tgt = reference[feature], target[feature]
+
+        if ref.kind == "categorical":
+            expected, actual = _align_categories(ref, tgt)
+            ks = None
+        elif json.loads(ref.bins) != json.loads(tgt.bins):
+            # 구간 경계가 다르면 비교 불가 (두 월을 같은 기준 월로 다시 집계해야 함)
+            results.append({"feature": feature, "kind": ref.kind, "psi": None, "ks": None, "status": "비교 불가"})
+            continue
+        else:
+            expected, actual = json.loads(ref.counts), json.loads(tgt.counts)
+            ks = _ks(np.asarray(expected), np.asarray(actual))
+
+        psi = _psi(expected, actual)
+        results.append({
+            "feature": feature,
+            "kind": ref.kind,
+            "psi": round(psi, 6),
+            "ks": round(ks, 6) if ks is not None else None,
+            "status": _status(psi),
+        })
+
+    return results
+
+
+# ✅ 월별 스코어링 이후 파이프라인에서 실행
+#    python drift.py --month 11        (해당 월만 집계)
+#    python drift.py --all             (tps_cancel_models 의 전체 월 집계)
+if __name__ == "__main__":
+    from database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="월별 드리프트 스케치 생성")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--month", type=int, help="집계할 유지 월")
+    target.add_argument("--all", action="store_true", help="전체 월 집계")
+    parser.add_argument("--reference-month", type=int, default=REFERENCE_MONTH, help="구간 경계 기준 월")
+    args = parser.parse_args()
+
+    create_table()
+
+    db = SessionLocal()
+    try:
+        if args.all:
+            # 기준 월을 먼저 집계해야 나머지 월이 새 구간 경계를 사용함
+            months = [row[0] for row in db.query(TpsCancelModels.p_mt).distinct().order_by(TpsCancelModels.p_mt).all()]
+            if args.reference_month in months:
+                months.remove(args.reference_month)
+                months.insert(0, args.reference_month)
+        else:
+            months = [args.month]
+
+        for month in months:
+            saved = build_month_sketches(db, month, args.reference_month)
+            print(f"✅ {month}월 스케치 {saved}개 저장 완료")
+    finally:
+        db.close()
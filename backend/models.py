@@ -142,3 +142,15 @@ class MonthlyChurnFactors(Base):
     feature_5 = Column(String(100), nullable=False)  # 5위 해지 요인
     impact_score_5 = Column(Float, nullable=False)
 
+
+
+class DriftSketch(Base):
+    __tablename__ = "drift_sketches"
+
+    p_mt = Column(Integer, primary_key=True, index=True)  # 유지 월 (PK)
+    feature = Column(String(100), primary_key=True)  # 피처명 (churn_probability 포함)
+    kind = Column(String(20), nullable=False)  # numeric / categorical
+    bins = Column(Text, nullable=False)  # JSON: numeric → 구간 경계값, categorical → 범주 목록
+    counts = Column(Text, nullable=False)  # JSON: 구간별 고객 수 (마지막 칸은 결측치)
+    total = Column(Integer, nullable=False)
+    created_at = Column(Date, default=date.today)
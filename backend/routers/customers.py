@@ -3,10 +3,28 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from database import get_db
 from models import TpsCancelModels as TpsCancelModel, CustomerSummary, CustomerFeatureImpact, MonthlySummary
-from schemas import TpsCancelModelsRead, CustomerSummaryRead, CustomerFeatureImpactRead, MonthlySummaryRead
+from schemas import TpsCancelModelsRead, CustomerSummaryRead, CustomerFeatureImpactRead, MonthlySummaryRead, CustomerSearchRead
 
 router = APIRouter()
 
+SHA2_HASH_LENGTH = 64
+TYPEAHEAD_MIN_LENGTH = 3  # 자동완성 최소 입력 길이
+
+
+def _hash_prefix_filter(search: str):
+    """
+    고객 ID(sha2_hash) 검색 조건 생성
+    - 전체 해시(64자)는 일치 검색, 일부만 입력하면 접두어 검색
+    - `LIKE 'abc%'` 는 PK(B-tree) 범위 스캔으로 처리됨
+    """
+    search = search.strip()
+    if len(search) == SHA2_HASH_LENGTH:
+        return CustomerSummary.sha2_hash == search
+
+    escaped = search.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return CustomerSummary.sha2_hash.like(f"{escaped}%", escape="/")
+
+
 # ✅ 고객 요약 정보 조회 API
 @router.get("/summary", response_model=List[CustomerSummaryRead])
 def get_customers_summary(
@@ -31,8 +49,8 @@ def get_customers_summary(
     )
 
     # 동적 필터 적용
-    if search:
-        query = query.filter(CustomerSummary.sha2_hash == search)
+    if search and search.strip():
+        query = query.filter(_hash_prefix_filter(search))
     if customer_category and customer_category != "ALL":
         query = query.filter(CustomerSummary.customer_category == customer_category)
     if prod_nm and prod_nm != "ALL":          # 상품 필터 조건 추가
@@ -58,6 +76,44 @@ def get_customers_summary(
 
 
 
+# ✅ 고객 ID 자동완성(typeahead) API
+@router.get("/search", response_model=List[CustomerSearchRead])
+def search_customers(
+    q: str = Query(..., description="고객 ID(sha2_hash) 앞부분 (3자 이상)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 반환 개수"),
+    db: Session = Depends(get_db),
+):
+    """
+    입력한 접두어로 시작하는 고객 ID 상위 `limit`개를 반환
+    - PK 순서로 정렬하여 인덱스 범위 스캔 후 바로 종료되도록 함
+    - 공백 제거 후 3자 미만이면 빈 목록 반환
+    """
+    q = q.strip()
+    if len(q) < TYPEAHEAD_MIN_LENGTH:
+        return []
+
+    results = (
+        db.query(
+            CustomerSummary.sha2_hash,
+            CustomerSummary.churn_probability,
+            CustomerSummary.customer_category
+        )
+        .filter(_hash_prefix_filter(q))
+        .order_by(CustomerSummary.sha2_hash)
+        .limit(limit)
+        .all()
+    )
+
+    return [
+        CustomerSearchRead(
+            sha2_hash=r[0],
+            churn_probability=r[1],
+            customer_category=r[2]
+        ) for r in results
+    ]
+
+
+
 # ✅ 특정 고객의 과거 이력 조회 API
 @router.get("/{sha2_hash}/detailed-history", response_model=Optional[TpsCancelModelsRead])
 def get_customer_detailed_history(
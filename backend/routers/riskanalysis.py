@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Optional
 from database import get_db
 from models import MonthlySummary, CustomerFeatureImpact, MonthlyChurnFactors
-from schemas import MonthlySummaryRead, RiskAnalysisRead
+from schemas import MonthlySummaryRead, RiskAnalysisRead, DriftMonthRead
+from drift import REFERENCE_MONTH, sketched_months, compare_months
 
 router = APIRouter()
 
@@ -81,3 +82,33 @@ def get_churn_factors(
         {"factor": result.feature_4, "impact": result.impact_score_4},
         {"factor": result.feature_5, "impact": result.impact_score_5}
     ]
+
+# ✅ 해지 확률 및 입력 피처 드리프트 (PSI/KS) API
+@router.get("/drift", response_model=List[DriftMonthRead])
+def get_drift(
+    reference_month: int = Query(REFERENCE_MONTH, description="기준 유지 월 (기본: 2월)"),
+    month: Optional[int] = Query(None, description="비교할 유지 월 (없으면 집계된 전체 월)"),
+    db: Session = Depends(get_db)
+):
+    """
+    기준 월 대비 월별 해지 확률 및 피처 분포 변화를 반환
+    - 월별 스케치(drift_sketches)만 읽어서 비교 (조회 전용)
+    - 스케치는 스코어링 이후 `python drift.py --month N` 으로 생성
+    """
+    if month is not None and month == reference_month:
+        raise HTTPException(status_code=400, detail="비교 월과 기준 월이 같습니다.")
+
+    available = sketched_months(db)
+    for required in [reference_month] + ([month] if month is not None else []):
+        if required not in available:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{required}월 드리프트 데이터가 없습니다. drift.py 로 먼저 집계하세요."
+            )
+
+    months = [month] if month is not None else [m for m in available if m != reference_month]
+
+    return [
+        {"p_mt": p_mt, "reference_month": reference_month, "features": compare_months(db, reference_month, p_mt)}
+        for p_mt in months
+    ]
@@ -43,6 +43,15 @@ class CustomerSummaryRead(BaseModel):
     class Config:
         from_attributes = True
 
+# ✅ 고객 ID 자동완성 응답 스키마
+class CustomerSearchRead(BaseModel):
+    sha2_hash: str
+    churn_probability: Optional[float]
+    customer_category: Optional[str]
+
+    class Config:
+        from_attributes = True
+
 # ✅ TpsCancelModels 관련 스키마
 class TpsCancelModelsRead(BaseModel):
     sha2_hash: str
@@ -109,3 +118,16 @@ class MonthlySummaryRead(BaseModel):
     
     class Config:
         from_attributes = True
+
+# ✅ 드리프트(PSI/KS) 모니터링 응답 스키마
+class DriftFeatureRead(BaseModel):
+    feature: str  # 피처명
+    kind: str  # numeric / categorical
+    psi: Optional[float]  # Population Stability Index (비교 불가 시 None)
+    ks: Optional[float]  # KS 통계량 (범주형 또는 비교 불가 시 None)
+    status: str  # 안정 / 주의 / 위험 / 비교 불가
+
+class DriftMonthRead(BaseModel):
+    p_mt: int  # 비교 대상 월
+    reference_month: int  # 기준 월
+    features: List[DriftFeatureRead]